@@ -1,6 +1,7 @@
 export interface SchemaType {
     settingsVersion: number;
     submenu: boolean;
+    activationWindow: number;
     applications: string[];
 }
 
@@ -12,6 +13,7 @@ export interface Application {
     pinned: boolean;
     multipleFiles: boolean;
     multipleFolders: boolean;
+    openProjectRoot?: boolean;
     packageType: 'Flatpak' | 'AppImage' | 'Native';
     mimeTypes?: string[];
     enable: boolean;
@@ -0,0 +1,267 @@
+"""
+menu_soak.py - Long-session soak and leak benchmark for Flickernaut menu construction.
+
+Simulates a workday of browsing by calling `get_file_items` and
+`get_background_items` tens of thousands of times over many distinct paths,
+using stand-in Nautilus/GLib/Gio objects so it runs headless. Memory growth
+after warm-up is tracked with tracemalloc, together with the number of live
+MenuItems, connected activate handlers and menu cache entries. Exits with a
+non-zero status when any of them passes its budget.
+
+Usage: python3 benchmarks/menu_soak.py [--calls N] [--paths N] [--budget-kib N]
+"""
+
+import argparse
+import gc
+import importlib.util
+import logging
+import os
+import shutil
+import sys
+import tracemalloc
+import types
+from typing import Any, Callable, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXTENSION_DIR = os.path.join(ROOT_DIR, "nautilus-extension")
+
+
+class MenuItem:
+    """Stand-in for Nautilus.MenuItem."""
+
+    def __init__(self, name: str = "", label: str = "") -> None:
+        self.name = name
+        self.label = label
+        self.submenu: Optional["Menu"] = None
+        self.handlers: list[tuple[str, Callable, tuple]] = []
+
+    @classmethod
+    def new(cls, name: str = "", label: str = "") -> "MenuItem":
+        return cls(name, label)
+
+    def connect(self, signal: str, callback: Callable, *args: Any) -> int:
+        self.handlers.append((signal, callback, args))
+        return len(self.handlers)
+
+    def set_submenu(self, submenu: "Menu") -> None:
+        self.submenu = submenu
+
+    def activate(self) -> None:
+        for signal, callback, args in self.handlers:
+            if signal == "activate":
+                callback(self, *args)
+
+
+class Menu:
+    """Stand-in for Nautilus.Menu."""
+
+    def __init__(self) -> None:
+        self.items: list[MenuItem] = []
+
+    def append_item(self, item: MenuItem) -> None:
+        self.items.append(item)
+
+
+class FileInfo:
+    """Stand-in for Nautilus.FileInfo."""
+
+    def __init__(self, path: str, is_directory: bool) -> None:
+        self._path = path
+        self._is_directory = is_directory
+
+    def get_location(self) -> "FileInfo":
+        return self
+
+    def get_path(self) -> str:
+        return self._path
+
+    def is_directory(self) -> bool:
+        return self._is_directory
+
+
+class DesktopAppInfo:
+    """Stand-in for Gio.DesktopAppInfo backed by /bin/sh."""
+
+    def __init__(self, app_id: str) -> None:
+        self._app_id = app_id
+
+    @classmethod
+    def new(cls, app_id: str) -> "DesktopAppInfo":
+        return cls(app_id)
+
+    def get_id(self) -> str:
+        return self._app_id
+
+    def get_executable(self) -> str:
+        return "/bin/sh"
+
+    def get_commandline(self) -> str:
+        return "/bin/sh %F"
+
+    def launch_uris(self, uris: list[str], ctx: Any) -> bool:
+        return True
+
+
+def _run_now(*args: Any) -> int:
+    """Run a GLib source callback immediately instead of scheduling it."""
+    callback, *data = args[1:] if isinstance(args[0], int) else args
+    callback(*data)
+    return 0
+
+
+def install_stand_ins() -> None:
+    """Register stand-in `gi.repository` modules before Flickernaut is imported."""
+    glib = types.SimpleNamespace(
+        SOURCE_REMOVE=False,
+        get_user_data_dir=lambda: os.path.join(ROOT_DIR, ".soak-data"),
+        get_home_dir=lambda: os.path.expanduser("~"),
+        get_user_runtime_dir=lambda: os.path.join(ROOT_DIR, ".soak-data"),
+        find_program_in_path=shutil.which,
+        filename_to_uri=lambda path, *args: f"file://{path}",
+        idle_add=_run_now,
+        timeout_add=_run_now,
+    )
+    gio = types.SimpleNamespace(
+        DesktopAppInfo=DesktopAppInfo,
+        SettingsSchemaSource=types.SimpleNamespace(
+            get_default=lambda: None,
+            new_from_directory=lambda *args: None,
+        ),
+    )
+    nautilus = types.SimpleNamespace(
+        MenuItem=MenuItem,
+        Menu=Menu,
+        MenuProvider=type("MenuProvider", (), {}),
+        FileInfo=FileInfo,
+    )
+    gobject = types.SimpleNamespace(Object=type("Object", (), {}))
+
+    repository = types.ModuleType("gi.repository")
+    repository.GLib = glib
+    repository.Gio = gio
+    repository.Nautilus = nautilus
+    repository.GObject = gobject
+
+    gi = types.ModuleType("gi")
+    gi.repository = repository
+
+    sys.modules["gi"] = gi
+    sys.modules["gi.repository"] = repository
+
+
+def load_extension() -> types.ModuleType:
+    """Import nautilus-flickernaut.py the way nautilus-python does."""
+    sys.path.insert(0, EXTENSION_DIR)
+    spec = importlib.util.spec_from_file_location(
+        "nautilus_flickernaut", os.path.join(EXTENSION_DIR, "nautilus-flickernaut.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def count_objects() -> dict[str, int]:
+    """Count live MenuItems and the activate handlers they hold."""
+    gc.collect()
+    items = [o for o in gc.get_objects() if isinstance(o, MenuItem)]
+    return {
+        "menu_items": len(items),
+        "handlers": sum(len(item.handlers) for item in items),
+    }
+
+
+def simulate(extension: Any, calls: int, paths: int, activate_every: int) -> None:
+    """Alternate file and background menu requests over `paths` distinct paths."""
+    for i in range(calls):
+        n = i % paths
+        folder = f"/home/user/projects/p{n % 97}/src/d{n}"
+
+        if i % 3 == 0:
+            items = extension.get_background_items(FileInfo(folder, True))
+        elif i % 3 == 1:
+            items = extension.get_file_items([FileInfo(f"{folder}/main.py", False)])
+        else:
+            items = extension.get_file_items(
+                [FileInfo(f"{folder}/a.py", False), FileInfo(f"{folder}/b.py", False)]
+            )
+
+        if activate_every and items and i % activate_every == 0:
+            items[0].activate()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--paths", type=int, default=20000)
+    parser.add_argument("--apps", type=int, default=8)
+    parser.add_argument("--activate-every", type=int, default=500)
+    parser.add_argument("--budget-kib", type=int, default=1024)
+    args = parser.parse_args()
+
+    install_stand_ins()
+    logging.disable(logging.CRITICAL)
+
+    extension_module = load_extension()
+    applications_registry = extension_module.applications_registry
+    from Flickernaut.models import Application
+    from Flickernaut.registry import MENU_CACHE_SIZE
+
+    for n in range(args.apps):
+        applications_registry.add_application(
+            Application(f"app{n}", f"app{n}.desktop", f"App {n}", n % 2 == 0, True, True)
+        )
+
+    extension = extension_module.FlickernautExtension()
+
+    # Warm up until the menu cache is saturated, then take the baseline
+    tracemalloc.start()
+    warmup = max(MENU_CACHE_SIZE * 4, args.calls // 10)
+    simulate(extension, warmup, args.paths, args.activate_every)
+
+    gc.collect()
+    baseline = tracemalloc.take_snapshot()
+    objects_before = count_objects()
+
+    simulate(extension, args.calls, args.paths, args.activate_every)
+
+    applications_registry.shutdown()
+    gc.collect()
+    final = tracemalloc.take_snapshot()
+    objects_after = count_objects()
+    tracemalloc.stop()
+
+    stats = final.compare_to(baseline, "lineno")
+    growth = sum(stat.size_diff for stat in stats)
+    cache_entries = applications_registry.menu_cache_size
+
+    # Every cached menu holds at most one item per app plus a submenu item
+    max_items = MENU_CACHE_SIZE * (args.apps + 1)
+
+    print(f"calls: {args.calls} over {args.paths} paths, {args.apps} apps")
+    print(f"memory growth after warm-up: {growth / 1024:.1f} KiB")
+    for key, before in objects_before.items():
+        print(f"{key}: {before} -> {objects_after[key]}")
+    print(f"menu cache entries: {cache_entries} (max {MENU_CACHE_SIZE})")
+    print(f"launches: {applications_registry.executor.launch_count}")
+    print("top allocations:")
+    for stat in stats[:5]:
+        print(f"  {stat}")
+
+    failures = []
+    if growth > args.budget_kib * 1024:
+        failures.append(f"memory grew {growth / 1024:.1f} KiB > {args.budget_kib} KiB")
+    if objects_after["menu_items"] > max_items:
+        failures.append(f"{objects_after['menu_items']} live MenuItems > {max_items}")
+    if objects_after["handlers"] > max_items:
+        failures.append(f"{objects_after['handlers']} activate handlers > {max_items}")
+    if cache_entries > MENU_CACHE_SIZE:
+        failures.append(f"{cache_entries} cache entries > {MENU_CACHE_SIZE}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
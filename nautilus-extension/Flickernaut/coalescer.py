@@ -0,0 +1,119 @@
+from typing import Hashable, Optional
+from gi.repository import GLib  # type: ignore
+from .logger import get_logger
+from .executor import LaunchCallback, LaunchExecutor, PathsPreparer
+from .launcher import Launcher
+
+logger = get_logger(__name__)
+
+# Window in which repeated activations for the same launcher are merged.
+COALESCE_WINDOW_MS: int = 300
+
+
+class PendingActivation:
+    """Activations collected for one launcher during the coalescing window."""
+
+    def __init__(
+        self,
+        launcher: Launcher,
+        paths: list[str],
+        prepare: Optional[PathsPreparer] = None,
+    ) -> None:
+        self.launcher = launcher
+        self.prepare = prepare
+        # dict preserves insertion order, so this doubles as an ordered set
+        self._paths: dict[str, None] = dict.fromkeys(paths)
+        self.count: int = 1
+
+    def add(self, paths: list[str]) -> None:
+        self._paths.update(dict.fromkeys(paths))
+        self.count += 1
+
+    @property
+    def paths(self) -> list[str]:
+        return list(self._paths)
+
+
+class ActivationCoalescer:
+    """Merges rapid repeated activations into a single deduplicated launch.
+
+    The first activation for a launcher opens a window of `window_ms`
+    milliseconds; every activation for the same launcher inside it is folded
+    into the pending launch, which is submitted to the executor when the
+    window closes. Launchers that cannot take multiple paths only merge
+    activations with identical paths.
+    """
+
+    def __init__(
+        self,
+        executor: LaunchExecutor,
+        callback: Optional[LaunchCallback] = None,
+        window_ms: int = COALESCE_WINDOW_MS,
+    ) -> None:
+        self._executor = executor
+        self._callback = callback
+        self._window_ms = max(0, window_ms)
+        self._pending: dict[Hashable, PendingActivation] = {}
+
+    def activate(
+        self,
+        launcher: Launcher,
+        paths: list[str],
+        *,
+        is_file: bool,
+        batch: bool,
+        prepare: Optional[PathsPreparer] = None,
+    ) -> None:
+        """Register an activation, merging it with a pending one if possible.
+
+        Args:
+            launcher: Launcher to run.
+            paths: Paths selected for this activation.
+            is_file: Whether the paths are files (True) or folders (False).
+            batch: Whether the application accepts several paths at once.
+            prepare: Hook run on the executor worker to rewrite the paths.
+        """
+        if self._window_ms == 0:
+            self._executor.submit(launcher, paths, self._callback, prepare)
+            return
+
+        key: Hashable = (
+            (launcher.app_id, is_file)
+            if batch
+            else (launcher.app_id, is_file, tuple(paths))
+        )
+
+        pending = self._pending.get(key)
+        if pending:
+            pending.add(paths)
+            logger.debug(
+                f"Coalesced activation #{pending.count} for {launcher.name}: {paths!r}"
+            )
+            return
+
+        self._pending[key] = PendingActivation(launcher, paths, prepare)
+        GLib.timeout_add(self._window_ms, self._flush, key)
+
+    def flush_all(self) -> None:
+        """Submit every pending activation immediately."""
+        for key in list(self._pending):
+            self._flush(key)
+
+    def _flush(self, key: Hashable) -> bool:
+        """Submit the pending activation for `key` once its window closes."""
+        pending = self._pending.pop(key, None)
+        if pending:
+            paths = pending.paths
+            if pending.count > 1:
+                logger.debug(
+                    f"Merged {pending.count} activations for {pending.launcher.name} into one launch: {paths!r}"
+                )
+            self._executor.submit(
+                pending.launcher, paths, self._callback, pending.prepare
+            )
+        return GLib.SOURCE_REMOVE
+
+    @property
+    def window_ms(self) -> int:
+        """Coalescing window in milliseconds, 0 when disabled."""
+        return self._window_ms
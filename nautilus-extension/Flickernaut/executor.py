@@ -0,0 +1,182 @@
+import queue
+import threading
+import time
+from typing import Callable, Optional
+from gi.repository import GLib  # type: ignore
+from .logger import get_logger
+from .launcher import Launcher
+
+logger = get_logger(__name__)
+
+# Callback invoked in the main loop once a launch has finished.
+LaunchCallback = Callable[[Launcher, list[str], bool], None]
+
+# Hook run on the worker thread to rewrite paths before launching.
+PathsPreparer = Callable[[list[str]], list[str]]
+
+# Maximum number of launches waiting for the worker.
+MAX_PENDING_LAUNCHES: int = 32
+
+
+class LaunchJob:
+    """A single launch request waiting in the executor queue."""
+
+    def __init__(
+        self,
+        launcher: Launcher,
+        paths: list[str],
+        callback: Optional[LaunchCallback] = None,
+        prepare: Optional[PathsPreparer] = None,
+    ) -> None:
+        self.launcher = launcher
+        self.paths = paths
+        self.callback = callback
+        self.prepare = prepare
+        self.submitted_at: float = time.monotonic()
+
+
+class LaunchExecutor:
+    """Runs launches on a background worker so the Nautilus UI never blocks.
+
+    Launches run in a single daemon thread fed by a bounded queue. The thread
+    calls the blocking `Launcher.launch`, so URI conversion, spawning and any
+    D-Bus activation happen off the main loop, and the reported result and
+    latency cover the whole launch. Results are posted back to the GLib main
+    loop with `GLib.idle_add`, so callbacks may safely touch Nautilus objects.
+    """
+
+    def __init__(self, max_pending: int = MAX_PENDING_LAUNCHES) -> None:
+        self._queue: queue.Queue[Optional[LaunchJob]] = queue.Queue(
+            maxsize=max_pending
+        )
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._last_latency: float = 0.0
+        self._total_latency: float = 0.0
+        self._launch_count: int = 0
+
+    def submit(
+        self,
+        launcher: Launcher,
+        paths: list[str],
+        callback: Optional[LaunchCallback] = None,
+        prepare: Optional[PathsPreparer] = None,
+    ) -> bool:
+        """Queue a launch for the worker thread.
+
+        Args:
+            launcher: Launcher to run.
+            paths: Paths to pass to the launcher.
+            callback: Called in the main loop with the launch result.
+            prepare: Called on the worker to rewrite `paths` before launching.
+
+        Returns:
+            bool: False if the queue is full and the launch was dropped.
+        """
+        job = LaunchJob(launcher, list(paths), callback, prepare)
+
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            logger.error(
+                f"Launch queue full ({self._queue.maxsize}), dropping launch for {launcher.name}"
+            )
+            return False
+
+        self._ensure_worker()
+        logger.debug(f"Queued launch for {launcher.name} (depth={self.queue_depth})")
+        return True
+
+    def shutdown(self) -> None:
+        """Stop the worker thread after the pending launches are processed."""
+        with self._lock:
+            worker = self._worker
+            self._worker = None
+
+        if worker and worker.is_alive():
+            self._queue.put(None)
+            worker.join()
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread on first use."""
+        with self._lock:
+            if self._worker and self._worker.is_alive():
+                return
+
+            self._worker = threading.Thread(
+                target=self._run, name="flickernaut-launcher", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Worker loop: launch queued jobs until a None sentinel is received."""
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+
+                try:
+                    if job.prepare:
+                        job.paths = job.prepare(job.paths)
+                    success = job.launcher.launch(job.paths)
+                except Exception as e:
+                    logger.error(f"Error during launching application: {e}")
+                    success = False
+
+                latency = time.monotonic() - job.submitted_at
+                self._record_latency(latency)
+                logger.debug(
+                    f"Launch of {job.launcher.name} took {latency * 1000:.1f} ms"
+                )
+
+                GLib.idle_add(self._dispatch, job, success)
+            finally:
+                self._queue.task_done()
+
+    def _record_latency(self, latency: float) -> None:
+        with self._lock:
+            self._last_latency = latency
+            self._total_latency += latency
+            self._launch_count += 1
+
+    @staticmethod
+    def _dispatch(job: LaunchJob, success: bool) -> bool:
+        """Deliver a launch result in the main loop."""
+        if job.callback:
+            try:
+                job.callback(job.launcher, job.paths, success)
+            except Exception as e:
+                logger.error(f"Error in launch callback: {e}")
+        return GLib.SOURCE_REMOVE
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of launches waiting for the worker."""
+        return self._queue.qsize()
+
+    @property
+    def launch_count(self) -> int:
+        """Number of launches processed so far."""
+        with self._lock:
+            return self._launch_count
+
+    @property
+    def last_latency(self) -> float:
+        """Seconds between submission and completion of the latest launch."""
+        with self._lock:
+            return self._last_latency
+
+    @property
+    def average_latency(self) -> float:
+        """Mean seconds between submission and completion of all launches."""
+        with self._lock:
+            if not self._launch_count:
+                return 0.0
+            return self._total_latency / self._launch_count
+
+    def __str__(self) -> str:
+        return (
+            f"LaunchExecutor(depth={self.queue_depth}, launches={self.launch_count}, "
+            f"avg_latency={self.average_latency * 1000:.1f}ms)"
+        )
@@ -1,5 +1,6 @@
 import os
 import shlex
+from typing import Any, Optional
 from gi.repository import GLib, Gio  # type: ignore
 from .logger import get_logger
 
@@ -9,14 +10,27 @@ logger = get_logger(__name__)
 class Launcher:
     """Handles launching a desktop application."""
 
-    def __init__(self, app_info: Gio.DesktopAppInfo, app_id: str, name: str) -> None:
+    def __init__(
+        self,
+        app_info: Optional[Gio.DesktopAppInfo],
+        app_id: str,
+        name: str,
+        state: Optional[dict[str, Any]] = None,
+    ) -> None:
         self.app_id = app_id
         self.name = name
         self._app_info = app_info
         self._launch_method = "none"
         self._run_command = ()
-        self._commandline = self._get_commandline(app_info)
-        self._set_launch_command()
+
+        if state is not None:
+            # Restore a launcher resolved elsewhere, app_info is loaded on demand
+            self._launch_method = state["method"]
+            self._run_command = tuple(state["run_command"])
+            self._commandline = list(state["commandline"])
+        else:
+            self._commandline = self._get_commandline(app_info)
+            self._set_launch_command()
 
         logger.debug(f"launcher method: {self._launch_method}")
         logger.debug(f"commandline: {self._commandline}")
@@ -94,14 +108,19 @@ class Launcher:
         self._init_failed = True
 
     def launch(self, paths: list[str]) -> bool:
-        """Launch the application based _launch_method."""
-        if self._launch_method == "gio-launch" and self._app_info:
+        """Launch the application based _launch_method.
+
+        Blocks until the application is spawned, so call it from the launch
+        executor worker rather than the main loop.
+        """
+        if self._launch_method == "gio-launch" and self.app_info:
             uris = [GLib.filename_to_uri(path) for path in paths]
             try:
                 logger.debug(f"Launching {self.name} with gio-launch: {paths}")
                 ctx = None
-                self._app_info.launch_uris_async(uris, ctx)
-                return True
+                # Blocking variant: launch_uris_async would finish the spawn
+                # in the default main context, i.e. on the Nautilus UI thread.
+                return self.app_info.launch_uris(uris, ctx)
             except Exception as e:
                 logger.error(
                     f"Failed to launch {self.name} with Gio.AppInfo.launch_uris: {e}"
@@ -133,9 +152,24 @@ class Launcher:
         logger.error(f"No valid launch method for {self.app_id}")
         return False
 
+    @property
+    def app_info(self) -> Optional[Gio.DesktopAppInfo]:
+        if self._app_info is None and self.app_id:
+            self._app_info = Gio.DesktopAppInfo.new(self.app_id)
+        return self._app_info
+
     @property
     def run_command(self) -> tuple[str, ...]:
         return self._run_command
 
+    @property
+    def state(self) -> dict[str, Any]:
+        """Resolved launch command, enough to restore this launcher without probing."""
+        return {
+            "method": self._launch_method,
+            "run_command": list(self._run_command),
+            "commandline": list(self._commandline),
+        }
+
     def __str__(self) -> str:
         return f"Launcher({self.name}, method={self._launch_method}, cmd={self._run_command})"
@@ -4,8 +4,10 @@ from functools import lru_cache
 from typing import Any, Optional
 from gi.repository import Gio, GLib  # type: ignore
 from .logger import get_logger
+from .coalescer import COALESCE_WINDOW_MS
 from .models import Application, AppJsonStruct
 from .registry import ApplicationsRegistry
+from .snapshot import fetch_snapshot, load_registry
 
 logger = get_logger(__name__)
 
@@ -23,6 +25,9 @@ def parse_app_entry(app: dict) -> Optional[AppJsonStruct]:
             multiple_folders=app.get(
                 "multiple_folders", app.get("multipleFolders", False)
             ),
+            open_project_root=app.get(
+                "open_project_root", app.get("openProjectRoot", False)
+            ),
             enable=app.get("enable", True),
         )
     except Exception as e:
@@ -90,12 +95,26 @@ class ApplicationConfigLoader:
 
         return value
 
+    @staticmethod
+    def get_activation_window_setting() -> int:
+        """Return the activation coalescing window in milliseconds."""
+        value = ApplicationConfigLoader.get_gsettings("activation-window")
+
+        if not isinstance(value, int):
+            logger.error(
+                f"GSettings key 'activation-window' returned unexpected type: {type(value)}"
+            )
+            return COALESCE_WINDOW_MS
+
+        return value
+
     @staticmethod
     def get_applications() -> ApplicationsRegistry:
         """Load and parse the configured applications from GSettings."""
         try:
             settings = ApplicationConfigLoader.get_gsettings("applications")
-            registry = ApplicationsRegistry()
+            window = ApplicationConfigLoader.get_activation_window_setting()
+            registry = ApplicationsRegistry(coalesce_window_ms=window)
 
             if not settings:
                 logger.warning("No applications found in GSettings")
@@ -133,6 +152,7 @@ class ApplicationConfigLoader:
                     schemaKey["pinned"],
                     schemaKey["multiple_files"],
                     schemaKey["multiple_folders"],
+                    schemaKey["open_project_root"],
                 )
 
                 logger.debug("")
@@ -145,6 +165,35 @@ class ApplicationConfigLoader:
             logger.critical(f"Fatal error in get_applications: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    def get_shared_registry() -> Optional[tuple[bool, ApplicationsRegistry]]:
+        """Load the submenu setting and registry from the registry service.
+
+        Returns:
+            Optional[tuple[bool, ApplicationsRegistry]]: None if the service is
+            not running or its snapshot is unusable.
+        """
+        data = fetch_snapshot()
+        if not data:
+            return None
+
+        shared = load_registry(data)
+        if shared:
+            logger.debug(f"Loaded registry snapshot from service ({len(data)} bytes)")
+        return shared
 
-submenu: bool = ApplicationConfigLoader.get_submenu_setting()
-applications_registry: ApplicationsRegistry = ApplicationConfigLoader.get_applications()
+    @staticmethod
+    def load() -> tuple[bool, ApplicationsRegistry]:
+        """Return the submenu setting and registry.
+
+        Uses the registry service snapshot when available, otherwise resolves
+        the applications in-process.
+        """
+        shared = ApplicationConfigLoader.get_shared_registry()
+        if shared:
+            return shared
+
+        return (
+            ApplicationConfigLoader.get_submenu_setting(),
+            ApplicationConfigLoader.get_applications(),
+        )
@@ -8,7 +8,7 @@ https://github.com/realmazharhussain/nautilus-code/blob/main/NautilusCode/types.
 
 import os
 from gettext import gettext as _
-from typing import Optional, TypedDict
+from typing import Any, Optional, TypedDict
 from gi.repository import GLib, Gio  # type: ignore
 from .logger import get_logger
 from .launcher import Launcher
@@ -23,16 +23,25 @@ class AppJsonStruct(TypedDict):
     pinned: bool
     multiple_files: bool
     multiple_folders: bool
+    open_project_root: bool
     enable: bool
 
 
 class Package:
     """Handles app installation checking."""
 
-    def __init__(self, app_id: str):
+    def __init__(self, app_id: str, is_installed: Optional[bool] = None):
         self.app_id = app_id
-        self.app_info = Gio.DesktopAppInfo.new(app_id) if app_id else None
-        self._is_installed_cache = None
+        self._app_info: Optional[Gio.DesktopAppInfo] = None
+        self._app_info_loaded = False
+        self._is_installed_cache = is_installed
+
+    @property
+    def app_info(self) -> Optional[Gio.DesktopAppInfo]:
+        if not self._app_info_loaded:
+            self._app_info = Gio.DesktopAppInfo.new(self.app_id) if self.app_id else None
+            self._app_info_loaded = True
+        return self._app_info
 
     @property
     def is_installed(self) -> bool:
@@ -106,6 +115,9 @@ class Application:
         pinned: bool = False,
         multiple_files: bool = False,
         multiple_folders: bool = False,
+        open_project_root: bool = False,
+        installed: Optional[bool] = None,
+        launcher_state: Optional[dict[str, Any]] = None,
     ) -> None:
         self.id: str = id
         self.app_id: str = app_id
@@ -113,9 +125,13 @@ class Application:
         self.pinned: bool = pinned
         self.multiple_files: bool = multiple_files
         self.multiple_folders: bool = multiple_folders
-        self.package = Package(app_id)
+        self.open_project_root: bool = open_project_root
+        self.package = Package(app_id, installed)
         self.launcher: Optional[Launcher] = None
-        if self.package.is_installed:
+        if launcher_state is not None:
+            # Resolved by the registry service, skip probing the app
+            self.launcher = Launcher(None, app_id, name, launcher_state)
+        elif self.package.is_installed:
             logger.debug(f"installed: {self.package.is_installed}")
             app_info = self.package.app_info
             try:
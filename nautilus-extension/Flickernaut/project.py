@@ -0,0 +1,95 @@
+import os
+import threading
+from typing import Optional
+from gi.repository import GLib  # type: ignore
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Files or folders whose presence marks a directory as a project root.
+PROJECT_MARKERS: tuple[str, ...] = (
+    ".git",
+    ".hg",
+    ".svn",
+    "pyproject.toml",
+    "setup.py",
+    "package.json",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+    "build.gradle",
+    "meson.build",
+    "CMakeLists.txt",
+)
+
+# Upper bound for cached directories before the index is reset.
+MAX_INDEXED_DIRS: int = 4096
+
+
+class ProjectRootResolver:
+    """Finds the project root enclosing a file, with a cached ancestor index.
+
+    Every directory visited while walking up is indexed with its mtime and
+    whether it holds a project marker. Creating or removing a marker changes
+    the directory mtime, so a cached verdict is reused as long as the mtime
+    is unchanged: repeated lookups in the same tree cost a single `stat` per
+    ancestor instead of probing every marker. The resolver is thread-safe, as
+    it runs on the launch executor worker.
+    """
+
+    def __init__(self, markers: tuple[str, ...] = PROJECT_MARKERS) -> None:
+        self._markers = markers
+        self._index: dict[str, tuple[int, bool]] = {}
+        self._lock = threading.Lock()
+        # Never treat the home directory or filesystem root as a project
+        self._boundaries = {os.path.abspath(GLib.get_home_dir()), os.sep}
+
+    def find_root(self, path: str) -> Optional[str]:
+        """Return the nearest ancestor of `path` containing a project marker."""
+        directory = os.path.dirname(os.path.abspath(path))
+
+        while directory not in self._boundaries:
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                return None
+
+            if self._is_root(directory, mtime):
+                return directory
+
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+
+        return None
+
+    def expand(self, paths: list[str]) -> list[str]:
+        """Prepend the project roots enclosing `paths`, without duplicates."""
+        roots = dict.fromkeys(
+            root for root in (self.find_root(p) for p in paths) if root
+        )
+        if not roots:
+            return paths
+
+        logger.debug(f"Project roots for {paths!r}: {list(roots)!r}")
+        return list(roots) + [p for p in paths if p not in roots]
+
+    def _is_root(self, directory: str, mtime: int) -> bool:
+        """Return whether `directory` holds a marker, using the index if fresh."""
+        with self._lock:
+            cached = self._index.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        is_root = any(
+            os.path.lexists(os.path.join(directory, marker))
+            for marker in self._markers
+        )
+
+        with self._lock:
+            if len(self._index) >= MAX_INDEXED_DIRS:
+                self._index.clear()
+            self._index[directory] = (mtime, is_root)
+
+        return is_root
@@ -1,18 +1,30 @@
+from collections import OrderedDict
 from gettext import gettext as _
 from gi.repository import Nautilus, GLib  # type: ignore
 from .logger import get_logger
+from .coalescer import COALESCE_WINDOW_MS, ActivationCoalescer
+from .executor import LaunchExecutor
 from .launcher import Launcher
 from .models import Application
+from .project import ProjectRootResolver
 
 logger = get_logger(__name__)
 
+# Maximum number of menus kept in the cache, least recently used are evicted.
+MENU_CACHE_SIZE: int = 256
+
 
 class ApplicationsRegistry(dict[str, Application]):
     """Registry of configured applications."""
 
-    def __init__(self):
+    def __init__(self, coalesce_window_ms: int = COALESCE_WINDOW_MS):
         super().__init__()
-        self._menu_cache = {}
+        self._menu_cache: OrderedDict[tuple, list[Nautilus.MenuItem]] = OrderedDict()
+        self._executor = LaunchExecutor()
+        self._project_roots = ProjectRootResolver()
+        self._coalescer = ActivationCoalescer(
+            self._executor, self._on_launch_finished, coalesce_window_ms
+        )
 
     def print_menu_cache(self):
         """Debug: Print all menu cache keys and their sizes."""
@@ -21,14 +33,44 @@ class ApplicationsRegistry(dict[str, Application]):
             logger.debug(f"Cache key: {k} | Items: {len(v)}")
         logger.debug("---- End of Menu Cache ----")
 
+    def _cache_menu(self, cache_key: tuple, items: list[Nautilus.MenuItem]) -> None:
+        """Store menu items, evicting the least recently used menus."""
+        self._menu_cache[cache_key] = items
+        while len(self._menu_cache) > MENU_CACHE_SIZE:
+            self._menu_cache.popitem(last=False)
+
+    @property
+    def menu_cache_size(self) -> int:
+        """Number of menus currently cached."""
+        return len(self._menu_cache)
+
     def add_application(self, application: Application) -> None:
         self[application.id] = application
 
-    @staticmethod
+    def shutdown(self) -> None:
+        """Launch activations still waiting in their window, then stop the worker."""
+        self._coalescer.flush_all()
+        self._executor.shutdown()
+
+    @property
+    def coalesce_window_ms(self) -> int:
+        """Window in which repeated activations are merged into one launch."""
+        return self._coalescer.window_ms
+
+    @property
+    def executor(self) -> LaunchExecutor:
+        """Background executor used for launching applications."""
+        return self._executor
+
     def _activate_menu_item(
-        item: Nautilus.MenuItem, launcher: Launcher, paths: list[str]
+        self,
+        item: Nautilus.MenuItem,
+        application: Application,
+        launcher: Launcher,
+        paths: list[str],
+        is_file: bool,
     ) -> None:
-        """Callback to activate a menu item and launch the command."""
+        """Callback to activate a menu item and queue the launch."""
         try:
             if not launcher:
                 logger.error("No valid launcher provided for menu item activation.")
@@ -36,18 +78,43 @@ class ApplicationsRegistry(dict[str, Application]):
             if not paths:
                 logger.error("No paths provided for launcher.")
                 return
-            if launcher.launch(paths):
-                logger.debug(
-                    f"Launch succeeded for {launcher.name} with paths: {paths!r}"
-                )
-                return
-            else:
-                logger.error(
-                    f"All launch methods failed for: {getattr(launcher, 'app_id', 'unknown')}"
-                )
+
+            # Only merge activations into one launch if the app takes several paths
+            batch = (
+                application.multiple_files
+                if is_file
+                else application.multiple_folders
+            )
+
+            # The root is an extra path, so only add it for apps taking several
+            # files; single-file apps would get a second window for it.
+            # Project root lookup touches the filesystem, so defer it to the worker
+            prepare = (
+                self._project_roots.expand
+                if is_file
+                and application.open_project_root
+                and application.multiple_files
+                else None
+            )
+
+            self._coalescer.activate(
+                launcher, paths, is_file=is_file, batch=batch, prepare=prepare
+            )
         except Exception as e:
             logger.error(f"Error during launching application: {e}")
 
+    def _on_launch_finished(
+        self, launcher: Launcher, paths: list[str], success: bool
+    ) -> None:
+        """Report the result of a queued launch, called in the main loop."""
+        if success:
+            logger.debug(f"Launch succeeded for {launcher.name} with paths: {paths!r}")
+            logger.debug(f"{self._executor}")
+        else:
+            logger.error(
+                f"All launch methods failed for: {getattr(launcher, 'app_id', 'unknown')}"
+            )
+
     def _create_menu_item(
         self,
         application: Application,
@@ -68,7 +135,9 @@ class ApplicationsRegistry(dict[str, Application]):
             label=label,
         )
 
-        item.connect("activate", self._activate_menu_item, launcher, paths)
+        item.connect(
+            "activate", self._activate_menu_item, application, launcher, paths, is_file
+        )
         return item
 
     def _filter_applications(
@@ -119,6 +188,7 @@ class ApplicationsRegistry(dict[str, Application]):
         if cache_key in self._menu_cache:
             # Uncomment for debugging cache hits
             # logger.debug(f"[CACHE HIT] Menu cache used for key: {cache_key}")
+            self._menu_cache.move_to_end(cache_key)
             return self._menu_cache[cache_key]
         # Uncomment for debugging cache misses
         # logger.debug(f"[CACHE MISS] Building menu for key: {cache_key}")
@@ -173,7 +243,7 @@ class ApplicationsRegistry(dict[str, Application]):
                     f"No menu items produced for paths: {paths!r} (is_file={is_file})"
                 )
 
-            self._menu_cache[cache_key] = result_items
+            self._cache_menu(cache_key, result_items)
             return result_items
 
         if not items:
@@ -181,5 +251,5 @@ class ApplicationsRegistry(dict[str, Application]):
                 f"No menu items produced for paths: {paths!r} (is_file={is_file})"
             )
 
-        self._menu_cache[cache_key] = items
+        self._cache_menu(cache_key, items)
         return items
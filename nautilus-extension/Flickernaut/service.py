@@ -0,0 +1,114 @@
+"""
+service.py - Optional registry service shared by all Nautilus processes of a user.
+
+Resolves the applications registry once (GSettings parse, Gio.DesktopAppInfo
+loading and install probes) and serves a compact snapshot over a Unix socket
+in the user runtime directory. Nautilus loads the snapshot in a single read
+and falls back to in-process resolution when the service is not running.
+
+Usage: python3 -m Flickernaut.service
+"""
+
+import os
+import logging
+import socketserver
+from typing import Any, Optional
+from .logger import get_logger
+from .manager import ApplicationConfigLoader
+from .snapshot import dump_registry, fetch_snapshot, get_socket_path
+
+logger = get_logger(__name__)
+
+
+class RegistryRequestHandler(socketserver.BaseRequestHandler):
+    """Writes the current snapshot to the client and closes the connection."""
+
+    server: "RegistryServer"
+
+    def handle(self) -> None:
+        try:
+            self.request.sendall(self.server.service.snapshot())
+        except OSError as e:
+            logger.warning(f"Failed to send registry snapshot: {e}")
+
+
+class RegistryServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: str, service: "RegistryService") -> None:
+        self.service = service
+        super().__init__(socket_path, RegistryRequestHandler)
+
+
+class RegistryService:
+    """Resolves the registry and keeps its snapshot in sync with GSettings.
+
+    Only the raw `applications`, `submenu` and `activation-window` settings
+    are read per request; the registry is resolved again only when they change.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None) -> None:
+        self.socket_path = socket_path or get_socket_path()
+        self._settings: Optional[tuple[Any, ...]] = None
+        self._snapshot: bytes = b""
+
+    def snapshot(self) -> bytes:
+        """Return the snapshot, resolving the registry again if settings changed."""
+        settings = (
+            tuple(ApplicationConfigLoader.get_gsettings("applications") or ()),
+            ApplicationConfigLoader.get_gsettings("submenu"),
+            ApplicationConfigLoader.get_gsettings("activation-window"),
+        )
+
+        if settings != self._settings or not self._snapshot:
+            registry = ApplicationConfigLoader.get_applications()
+            submenu = ApplicationConfigLoader.get_submenu_setting()
+            self._snapshot = dump_registry(registry, submenu)
+            self._settings = settings
+            logger.info(
+                f"Resolved registry: {len(registry)} apps, {len(self._snapshot)} bytes"
+            )
+
+        return self._snapshot
+
+    def serve_forever(self) -> None:
+        """Listen on the socket until interrupted.
+
+        Raises:
+            RuntimeError: If another registry service is already running.
+        """
+        if fetch_snapshot(self.socket_path):
+            raise RuntimeError(f"Registry service already running at {self.socket_path}")
+
+        os.makedirs(os.path.dirname(self.socket_path), mode=0o700, exist_ok=True)
+
+        # Left behind by a service that did not shut down cleanly
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        # Resolve up front so the first client does not wait for it
+        self.snapshot()
+
+        with RegistryServer(self.socket_path, self) as server:
+            os.chmod(self.socket_path, 0o600)
+            logger.info(f"Serving registry snapshot at {self.socket_path}")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.unlink(self.socket_path)
+
+
+def main() -> None:
+    # get_logger only shows warnings outside debug builds; the service is run
+    # from a terminal, so report where it listens and what it resolved.
+    if logger.level > logging.INFO:
+        logger.setLevel(logging.INFO)
+
+    try:
+        RegistryService().serve_forever()
+    except RuntimeError as e:
+        logger.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
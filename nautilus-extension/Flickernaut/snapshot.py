@@ -0,0 +1,122 @@
+import os
+import json
+import socket
+from typing import Any, Optional
+from gi.repository import GLib  # type: ignore
+from .logger import get_logger
+from .coalescer import COALESCE_WINDOW_MS
+from .models import Application
+from .registry import ApplicationsRegistry
+
+logger = get_logger(__name__)
+
+# Bump when the snapshot layout changes, older snapshots are then ignored.
+SNAPSHOT_VERSION: int = 1
+
+# Seconds to wait for the registry service before resolving in-process.
+SOCKET_TIMEOUT: float = 0.5
+
+
+def get_socket_path() -> str:
+    """Return the per-user registry service socket path."""
+    return os.path.join(GLib.get_user_runtime_dir(), "flickernaut", "registry.sock")
+
+
+def dump_registry(registry: ApplicationsRegistry, submenu: bool) -> bytes:
+    """Serialize a resolved registry into a compact JSON snapshot."""
+    apps = []
+
+    for app in registry.values():
+        apps.append(
+            {
+                "id": app.id,
+                "app_id": app.app_id,
+                "name": app.name,
+                "pinned": app.pinned,
+                "multiple_files": app.multiple_files,
+                "multiple_folders": app.multiple_folders,
+                "open_project_root": app.open_project_root,
+                "installed": app.package.is_installed,
+                "launcher": app.launcher.state if app.launcher else None,
+            }
+        )
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "submenu": submenu,
+        "activation_window": registry.coalesce_window_ms,
+        "apps": apps,
+    }
+    return json.dumps(snapshot, separators=(",", ":")).encode("utf-8")
+
+
+def load_registry(data: bytes) -> Optional[tuple[bool, ApplicationsRegistry]]:
+    """Rebuild the submenu setting and registry from a snapshot.
+
+    Returns:
+        Optional[tuple[bool, ApplicationsRegistry]]: None if the snapshot is invalid.
+    """
+    try:
+        snapshot: dict[str, Any] = json.loads(data)
+
+        if not isinstance(snapshot, dict):
+            logger.error(f"Invalid registry snapshot: {type(snapshot).__name__}")
+            return None
+
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            logger.warning(
+                f"Ignoring registry snapshot version {snapshot.get('version')!r}"
+            )
+            return None
+
+        registry = ApplicationsRegistry(
+            coalesce_window_ms=int(
+                snapshot.get("activation_window", COALESCE_WINDOW_MS)
+            )
+        )
+
+        for entry in snapshot["apps"]:
+            registry.add_application(
+                Application(
+                    entry["id"],
+                    entry["app_id"],
+                    entry["name"],
+                    entry["pinned"],
+                    entry["multiple_files"],
+                    entry["multiple_folders"],
+                    entry["open_project_root"],
+                    installed=entry["installed"],
+                    launcher_state=entry["launcher"],
+                )
+            )
+
+        return bool(snapshot["submenu"]), registry
+
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        logger.error(f"Invalid registry snapshot: {e}")
+        return None
+
+
+def fetch_snapshot(
+    path: Optional[str] = None, timeout: float = SOCKET_TIMEOUT
+) -> Optional[bytes]:
+    """Read a snapshot from the registry service, None if it is not running."""
+    path = path or get_socket_path()
+    if not os.path.exists(path):
+        return None
+
+    chunks: list[bytes] = []
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+
+    except OSError as e:
+        logger.debug(f"Registry service unavailable at {path}: {e}")
+        return None
+
+    return b"".join(chunks) or None
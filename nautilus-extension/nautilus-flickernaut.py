@@ -1,9 +1,10 @@
 import os.path
+import atexit
 import gettext
 from typing import Optional
 from Flickernaut.logger import get_logger
 from gi.repository import Nautilus, GObject, GLib  # type: ignore
-from Flickernaut.manager import applications_registry, submenu
+from Flickernaut.manager import ApplicationConfigLoader
 
 logger = get_logger(__name__)
 
@@ -31,6 +32,12 @@ except Exception as e:
     logger.error(f"gettext init failed: {e}")
     _ = lambda s: s
 
+# Resolve the configured applications once per Nautilus process
+submenu, applications_registry = ApplicationConfigLoader.load()
+
+# Don't drop activations still waiting in the coalescing window on exit
+atexit.register(applications_registry.shutdown)
+
 
 class FlickernautExtension(GObject.Object, Nautilus.MenuProvider):
     """Nautilus extension providing IDE/editor or other apps context menu integration."""
@@ -10,6 +10,7 @@ export const SchemaKey = {
     applications: 'applications',
     settingsVersion: 'settings-version',
     submenu: 'submenu',
+    activationWindow: 'activation-window',
 } as const;
 
 /**
@@ -17,7 +18,7 @@ export const SchemaKey = {
  *
  * The values represent the type of schema variant:
  * - `'as'`: Application schema
- * - `'u'`: Unsigned integer schema (e.g., version)
+ * - `'u'`: Unsigned integer schema (e.g., version, activation window)
  * - `'b'`: Boolean schema (e.g., submenu)
  *
  * @remarks
@@ -27,6 +28,7 @@ const SchemaVariant: Record<(typeof SchemaKey)[keyof typeof SchemaKey], string>
     'applications': 'as',
     'settings-version': 'u',
     'submenu': 'b',
+    'activation-window': 'u',
 } as const;
 
 /**
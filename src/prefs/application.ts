@@ -184,6 +184,7 @@ export const ApplicationPage = GObject.registerClass(
                         pinned: false,
                         multipleFiles: false,
                         multipleFolders: false,
+                        openProjectRoot: false,
                         packageType,
                         mimeTypes,
                         enable: true,
@@ -19,6 +19,7 @@ export class ApplicationListClass extends Adw.ExpanderRow {
     private declare _pinned: boolean;
     private declare _multiple_files: Adw.SwitchRow;
     private declare _multiple_folders: Adw.SwitchRow;
+    private declare _open_project_root: Adw.SwitchRow;
     private declare _packageType: 'Flatpak' | 'AppImage' | 'Native';
     private declare _mime_types: Adw.EntryRow;
     private declare _pin_button: Gtk.Button;
@@ -49,6 +50,10 @@ export class ApplicationListClass extends Adw.ExpanderRow {
 
         this._multiple_folders.active = application.multipleFolders || false;
 
+        this._open_project_root.active = application.openProjectRoot || false;
+
+        this._open_project_root.sensitive = this._multiple_files.active;
+
         this._packageType = application.packageType || 'Native';
 
         this._mime_types.text = normalizeArrayOutput(application.mimeTypes);
@@ -96,6 +101,7 @@ export class ApplicationListClass extends Adw.ExpanderRow {
         });
 
         this._multiple_files.connect('notify::active', () => {
+            this._open_project_root.sensitive = this._multiple_files.active;
             this._updateAppSetting();
         });
 
@@ -103,6 +109,10 @@ export class ApplicationListClass extends Adw.ExpanderRow {
             this._updateAppSetting();
         });
 
+        this._open_project_root.connect('notify::active', () => {
+            this._updateAppSetting();
+        });
+
         this._mime_types.connect('changed', () => {
             this._updateAppSetting();
         });
@@ -146,6 +156,7 @@ export class ApplicationListClass extends Adw.ExpanderRow {
             pinned: this._pinned,
             multipleFiles: this._multiple_files.active,
             multipleFolders: this._multiple_folders.active,
+            openProjectRoot: this._open_project_root.active,
             packageType: this._packageType,
             mimeTypes: normalizeArray(this._mime_types.text),
             enable: this._toggleSwitch.active,
@@ -182,6 +193,7 @@ export const ApplicationList = GObject.registerClass(
             'name',
             'multiple_files',
             'multiple_folders',
+            'open_project_root',
             'mime_types',
             'remove_app_button',
         ],
@@ -18,12 +18,14 @@ export const GeneralPage = GObject.registerClass(
             'banner',
             'behavior',
             'submenu',
+            'activation_window',
         ],
     },
     class extends Adw.PreferencesPage {
         private declare _banner: Adw.Banner;
         private declare _behavior: Adw.PreferencesGroup;
         private declare _submenu: Adw.SwitchRow;
+        private declare _activation_window: Adw.SpinRow;
         private declare _schemaKey: typeof SchemaKey;
         private declare _bannerHandler: BannerHandler;
 
@@ -41,6 +43,12 @@ export const GeneralPage = GObject.registerClass(
             this._submenu.connect('notify::active', () => {
                 setSettings(this._schemaKey.submenu, this._submenu.active, this._bannerHandler);
             });
+
+            this._activation_window.value = getSettings('activationWindow').valueOf();
+
+            this._activation_window.connect('notify::value', () => {
+                setSettings('activationWindow', Math.round(this._activation_window.value), this._bannerHandler);
+            });
         }
     },
 );